@@ -1,23 +1,70 @@
 from flask import Flask, jsonify, request
-from metatrader_connector import MetaTraderConnector
+from flask.json.provider import DefaultJSONProvider
+from metatrader_connector import MetaTraderConnector, TTLCache
+from mt5_worker import MetaTraderWorkerClient
 from ichimoku import IchimokuCalculator
 import logging
+import numpy as np
+import orjson
+import os
+import threading
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson; serializes large /ichimoku payloads
+    (and NumPy arrays) in native code instead of the stdlib json module"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize MetaTrader connector
-mt_connector = MetaTraderConnector()
+# MetaTrader connector, created lazily on first use so workers boot fast and
+# an unavailable terminal degrades to per-request errors instead of failing
+# at import. With MT5_WORKER_ADDRESS set (host:port), calls are forwarded to
+# a dedicated worker process (python mt5_worker.py) so all web workers share
+# one terminal connection instead of each attaching their own.
+_mt_connector = None
+_mt_lock = threading.Lock()
+
+
+def get_mt():
+    """Return the shared MetaTrader connector, connecting on first need"""
+    global _mt_connector
+    if _mt_connector is None:
+        with _mt_lock:
+            if _mt_connector is None:
+                worker_address = os.environ.get('MT5_WORKER_ADDRESS')
+                if worker_address:
+                    host, _, port = worker_address.rpartition(':')
+                    _mt_connector = MetaTraderWorkerClient((host or '127.0.0.1', int(port)))
+                else:
+                    _mt_connector = MetaTraderConnector()
+    if not _mt_connector.is_connected():
+        if not _mt_connector.initialize():
+            logger.warning("MetaTrader connection failed. Some endpoints may not work.")
+    return _mt_connector
+
 
 # Initialize Ichimoku calculator
 ichimoku_calc = IchimokuCalculator()
 
+# Cache of computed Ichimoku responses so repeated requests within the TTL
+# skip both the MT5 round-trip and the indicator recomputation
+ichimoku_cache = TTLCache(maxsize=128, ttl=30.0)
+
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({'status': 'healthy', 'mt_connected': mt_connector.is_connected()})
+    return jsonify({'status': 'healthy', 'mt_connected': get_mt().is_connected()})
 
 
 @app.route('/quotes', methods=['GET'])
@@ -45,7 +92,7 @@ def get_quotes():
             return jsonify({'error': 'symbol parameter is required'}), 400
         
         # Get quotes from MetaTrader
-        quotes_data = mt_connector.get_quotes(
+        quotes_data = get_mt().get_quotes(
             symbol=symbol,
             timeframe=timeframe,
             count=count,
@@ -72,7 +119,7 @@ def get_quotes():
 def get_symbols():
     """Get list of available symbols from MetaTrader"""
     try:
-        symbols = mt_connector.get_symbols()
+        symbols = get_mt().get_symbols()
         if symbols is None:
             return jsonify({'error': 'Failed to retrieve symbols'}), 500
         return jsonify({'symbols': symbols})
@@ -91,6 +138,8 @@ def get_ichimoku():
     - count: Number of hourly bars to retrieve (default: 200, minimum 52 for Ichimoku)
     - start_date: Start date in format 'YYYY-MM-DD' (optional)
     - end_date: End date in format 'YYYY-MM-DD' (optional)
+    - layout: 'records' (default, one dict per candle) or 'columnar'
+      (one array per field, serialized zero-copy by orjson)
     """
     try:
         # Get query parameters
@@ -98,18 +147,27 @@ def get_ichimoku():
         count = request.args.get('count', type=int, default=200)
         start_date = request.args.get('start_date', type=str)
         end_date = request.args.get('end_date', type=str)
-        
+        layout = request.args.get('layout', type=str, default='records')
+
         # Validate required parameters
         if not symbol:
             return jsonify({'error': 'symbol parameter is required'}), 400
+        if layout not in ('records', 'columnar'):
+            return jsonify({'error': 'layout must be "records" or "columnar"'}), 400
         
         # Ensure we have enough data for Ichimoku calculation (need at least 52 periods)
         if count < 52:
             count = 200  # Default to 200 to ensure we have enough data
             logger.warning(f"Count too low for Ichimoku, using default: 200")
-        
+
+        # Return a recently computed response if the same query was just served
+        cache_key = (symbol, count, start_date, end_date, layout)
+        cached_response = ichimoku_cache.get(cache_key)
+        if cached_response is not None:
+            return jsonify(cached_response)
+
         # Get hourly quotes from MetaTrader
-        quotes_data = mt_connector.get_quotes(
+        quotes_data = get_mt().get_quotes(
             symbol=symbol,
             timeframe='H1',  # Always use hourly for Ichimoku
             count=count,
@@ -123,32 +181,152 @@ def get_ichimoku():
         if len(quotes_data) == 0:
             return jsonify({'error': 'No quotes data available'}), 404
         
-        # Calculate Ichimoku indicators and signals
-        ichimoku_data = ichimoku_calc.calculate_with_signals(quotes_data)
-        
+        if layout == 'columnar':
+            # One array per field; orjson serializes the NumPy arrays directly
+            columnar_data = ichimoku_calc.calculate_columnar(quotes_data)
+            if columnar_data is None:
+                return jsonify({'error': 'Failed to calculate Ichimoku data'}), 500
+
+            signal_names = ('neutral', 'buy', 'sell')
+            response = {
+                'symbol': symbol,
+                'timeframe': 'H1',
+                'layout': 'columnar',
+                'total_candles': len(columnar_data['time']),
+                'latest_signal': signal_names[int(columnar_data['signal'][-1])],
+                'data': columnar_data
+            }
+            ichimoku_cache.put(cache_key, response)
+            return jsonify(response)
+
+        # Calculate Ichimoku indicators and signals (cached per symbol so only
+        # newly arrived bars are recomputed on repeat polls)
+        ichimoku_data = ichimoku_calc.calculate_with_signals(quotes_data, symbol=symbol)
+
         # Get the latest signal
         latest_signal = None
         if ichimoku_data and len(ichimoku_data) > 0:
             latest_candle = ichimoku_data[-1]
             latest_signal = latest_candle.get('signal', {})
-        
-        return jsonify({
+
+        response = {
             'symbol': symbol,
             'timeframe': 'H1',
             'total_candles': len(ichimoku_data),
             'latest_signal': latest_signal,
             'data': ichimoku_data
-        })
+        }
+        ichimoku_cache.put(cache_key, response)
+        return jsonify(response)
         
     except Exception as e:
         logger.error(f"Error getting Ichimoku data: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/ichimoku/batch', methods=['GET'])
+def get_ichimoku_batch():
+    """
+    Get Ichimoku indicators and signals for several symbols in one request
+
+    All symbols are stacked into one (num_symbols, num_bars) matrix and the
+    rolling kernels run once as a parallel gufunc across symbols. Data is
+    returned in columnar layout per symbol (see /ichimoku?layout=columnar
+    for the cloud_status and signal codes).
+
+    Query parameters:
+    - symbols: Comma-separated currency pairs (e.g., 'EURUSD,GBPUSD') - required
+    - count: Number of hourly bars per symbol (default: 200, minimum 52)
+    """
+    try:
+        symbols_arg = request.args.get('symbols', type=str)
+        count = request.args.get('count', type=int, default=200)
+
+        if not symbols_arg:
+            return jsonify({'error': 'symbols parameter is required'}), 400
+        symbols = [s.strip().upper() for s in symbols_arg.split(',') if s.strip()]
+        if not symbols:
+            return jsonify({'error': 'symbols parameter is required'}), 400
+
+        if count < 52:
+            count = 200
+            logger.warning(f"Count too low for Ichimoku, using default: 200")
+
+        cache_key = ('batch', tuple(symbols), count)
+        cached_response = ichimoku_cache.get(cache_key)
+        if cached_response is not None:
+            return jsonify(cached_response)
+
+        # Fetch quotes per symbol; failures are reported, not fatal
+        per_symbol = {}
+        errors = {}
+        for symbol in symbols:
+            quotes_data = get_mt().get_quotes(symbol=symbol, timeframe='H1', count=count)
+            if quotes_data:
+                per_symbol[symbol] = quotes_data
+            else:
+                errors[symbol] = 'Failed to retrieve quotes data'
+
+        if not per_symbol:
+            return jsonify({'error': 'No quotes data available', 'errors': errors}), 500
+
+        # Stack into (num_symbols, num_bars) matrices, padding shorter series
+        # with leading NaN so the batch kernel can run in one call
+        fetched = list(per_symbol.items())
+        n = max(len(quotes) for _, quotes in fetched)
+        num_symbols = len(fetched)
+        high = np.full((num_symbols, n), np.nan)
+        low = np.full((num_symbols, n), np.nan)
+        close = np.full((num_symbols, n), np.nan)
+        open_ = np.full((num_symbols, n), np.nan)
+        pads = []
+        for i, (_, quotes) in enumerate(fetched):
+            pad = n - len(quotes)
+            pads.append(pad)
+            high[i, pad:] = [q['high'] for q in quotes]
+            low[i, pad:] = [q['low'] for q in quotes]
+            close[i, pad:] = [q['close'] for q in quotes]
+            open_[i, pad:] = [q.get('open', np.nan) for q in quotes]
+
+        batch = ichimoku_calc.calculate_batch(high, low, close)
+
+        signal_names = ('neutral', 'buy', 'sell')
+        data = {}
+        for i, (symbol, quotes) in enumerate(fetched):
+            pad = pads[i]
+            data[symbol] = {
+                'time': [q.get('time') for q in quotes],
+                'open': open_[i, pad:],
+                'high': high[i, pad:],
+                'low': low[i, pad:],
+                'close': close[i, pad:],
+                'ichimoku': {
+                    'tenkan_sen': batch['tenkan_sen'][i, pad:],
+                    'kijun_sen': batch['kijun_sen'][i, pad:],
+                    'senkou_span_a': batch['senkou_span_a'][i, pad:],
+                    'senkou_span_b': batch['senkou_span_b'][i, pad:],
+                    'chikou_span': batch['chikou_span'][i, pad:],
+                    'cloud_status': batch['cloud_status'][i, pad:],
+                },
+                'signal': batch['signal'][i, pad:],
+                'latest_signal': signal_names[int(batch['signal'][i, -1])],
+            }
+
+        response = {
+            'timeframe': 'H1',
+            'layout': 'columnar',
+            'symbols': data,
+            'errors': errors
+        }
+        ichimoku_cache.put(cache_key, response)
+        return jsonify(response)
+
+    except Exception as e:
+        logger.error(f"Error getting batch Ichimoku data: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+
 if __name__ == '__main__':
-    # Initialize MetaTrader connection
-    if not mt_connector.initialize():
-        logger.warning("MetaTrader connection failed. Some endpoints may not work.")
-    
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Development entrypoint only; use gunicorn in production (see README)
+    app.run(host='0.0.0.0', port=5000)
 
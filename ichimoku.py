@@ -1,10 +1,203 @@
 import pandas as pd
 import numpy as np
+from numba import njit, guvectorize
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@njit(cache=True, fastmath=True)
+def _rolling_minmax(high, low, window, out_max, out_min):
+    """
+    Rolling max of `high` and rolling min of `low` over `window` bars.
+
+    Monotonic-deque algorithm: O(n) instead of the O(n*window) naive scan,
+    single compiled sweep over both arrays. The first (window - 1) outputs
+    are NaN, matching pandas rolling with min_periods=window.
+    """
+    n = high.shape[0]
+    max_idx = np.empty(n, dtype=np.int64)
+    min_idx = np.empty(n, dtype=np.int64)
+    max_head = 0
+    max_tail = 0
+    min_head = 0
+    min_tail = 0
+
+    for i in range(n):
+        # Push current bar, popping dominated entries from the back
+        h = high[i]
+        while max_tail > max_head and high[max_idx[max_tail - 1]] <= h:
+            max_tail -= 1
+        max_idx[max_tail] = i
+        max_tail += 1
+
+        l = low[i]
+        while min_tail > min_head and low[min_idx[min_tail - 1]] >= l:
+            min_tail -= 1
+        min_idx[min_tail] = i
+        min_tail += 1
+
+        # Drop entries that fell out of the window
+        if max_idx[max_head] <= i - window:
+            max_head += 1
+        if min_idx[min_head] <= i - window:
+            min_head += 1
+
+        if i >= window - 1:
+            out_max[i] = high[max_idx[max_head]]
+            out_min[i] = low[min_idx[min_head]]
+        else:
+            out_max[i] = np.nan
+            out_min[i] = np.nan
+
+
+@njit(cache=True, fastmath=True)
+def _ichimoku_cores(high, low, tenkan_w, kijun_w, senkou_b_w,
+                    out_tenkan, out_kijun, out_senkou_b):
+    """
+    Fused Tenkan/Kijun/Senkou-B midline computation in a single sweep.
+
+    Maintains the three (max, min) deque pairs side by side so high/low are
+    traversed once instead of once per window, and writes (max + min) / 2
+    for each line directly. Same NaN warmup semantics as _rolling_minmax.
+    """
+    n = high.shape[0]
+    t_max_idx = np.empty(n, dtype=np.int64)
+    t_min_idx = np.empty(n, dtype=np.int64)
+    k_max_idx = np.empty(n, dtype=np.int64)
+    k_min_idx = np.empty(n, dtype=np.int64)
+    s_max_idx = np.empty(n, dtype=np.int64)
+    s_min_idx = np.empty(n, dtype=np.int64)
+    t_max_head = t_max_tail = t_min_head = t_min_tail = 0
+    k_max_head = k_max_tail = k_min_head = k_min_tail = 0
+    s_max_head = s_max_tail = s_min_head = s_min_tail = 0
+
+    for i in range(n):
+        h = high[i]
+        l = low[i]
+
+        # Tenkan window
+        while t_max_tail > t_max_head and high[t_max_idx[t_max_tail - 1]] <= h:
+            t_max_tail -= 1
+        t_max_idx[t_max_tail] = i
+        t_max_tail += 1
+        while t_min_tail > t_min_head and low[t_min_idx[t_min_tail - 1]] >= l:
+            t_min_tail -= 1
+        t_min_idx[t_min_tail] = i
+        t_min_tail += 1
+        if t_max_idx[t_max_head] <= i - tenkan_w:
+            t_max_head += 1
+        if t_min_idx[t_min_head] <= i - tenkan_w:
+            t_min_head += 1
+
+        # Kijun window
+        while k_max_tail > k_max_head and high[k_max_idx[k_max_tail - 1]] <= h:
+            k_max_tail -= 1
+        k_max_idx[k_max_tail] = i
+        k_max_tail += 1
+        while k_min_tail > k_min_head and low[k_min_idx[k_min_tail - 1]] >= l:
+            k_min_tail -= 1
+        k_min_idx[k_min_tail] = i
+        k_min_tail += 1
+        if k_max_idx[k_max_head] <= i - kijun_w:
+            k_max_head += 1
+        if k_min_idx[k_min_head] <= i - kijun_w:
+            k_min_head += 1
+
+        # Senkou B window
+        while s_max_tail > s_max_head and high[s_max_idx[s_max_tail - 1]] <= h:
+            s_max_tail -= 1
+        s_max_idx[s_max_tail] = i
+        s_max_tail += 1
+        while s_min_tail > s_min_head and low[s_min_idx[s_min_tail - 1]] >= l:
+            s_min_tail -= 1
+        s_min_idx[s_min_tail] = i
+        s_min_tail += 1
+        if s_max_idx[s_max_head] <= i - senkou_b_w:
+            s_max_head += 1
+        if s_min_idx[s_min_head] <= i - senkou_b_w:
+            s_min_head += 1
+
+        if i >= tenkan_w - 1:
+            out_tenkan[i] = (high[t_max_idx[t_max_head]] + low[t_min_idx[t_min_head]]) / 2
+        else:
+            out_tenkan[i] = np.nan
+        if i >= kijun_w - 1:
+            out_kijun[i] = (high[k_max_idx[k_max_head]] + low[k_min_idx[k_min_head]]) / 2
+        else:
+            out_kijun[i] = np.nan
+        if i >= senkou_b_w - 1:
+            out_senkou_b[i] = (high[s_max_idx[s_max_head]] + low[s_min_idx[s_min_head]]) / 2
+        else:
+            out_senkou_b[i] = np.nan
+
+
+@guvectorize(['void(float64[:], float64[:], int64, float64[:], float64[:])'],
+             '(n),(n),()->(n),(n)', nopython=True, target='parallel', cache=True)
+def _rolling_minmax_batch(high, low, window, out_max, out_min):
+    """
+    gufunc form of _rolling_minmax: given (num_symbols, num_bars) high/low
+    matrices it runs the deque kernel per row, parallelized across symbols.
+
+    Rows padded with leading NaN are handled naturally: a NaN entry is never
+    popped by value comparison, so any window containing padding yields NaN.
+    """
+    _rolling_minmax(high, low, window, out_max, out_min)
+
+
+# Signal-condition bit positions (see _build_signal_lut)
+_COND_NAMES = ('price_above_cloud', 'price_below_cloud',
+               'kijun_above_tenkan', 'kijun_below_tenkan',
+               'chikou_above_price', 'chikou_below_price')
+
+# Missing-field bit positions for rows without enough data
+_FIELD_NAMES = ('close', 'tenkan_sen', 'kijun_sen', 'chikou_span',
+                'senkou_span_a_unshifted', 'senkou_span_b_unshifted')
+
+
+def _build_signal_lut():
+    """
+    Build the 64-entry signal dict lookup table, one per condition bitmap.
+
+    Buy needs bits 0, 2, 4 (above cloud, Kijun above Tenkan, Chikou above
+    price); sell needs bits 1, 3, 5. The dicts are shared read-only across
+    rows so the hot loop only indexes, never allocates.
+    """
+    lut = []
+    for bits in range(64):
+        conditions = {name: bool(bits & (1 << bit)) for bit, name in enumerate(_COND_NAMES)}
+        if conditions['price_above_cloud'] and conditions['kijun_above_tenkan'] \
+                and conditions['chikou_above_price']:
+            signal = 'buy'
+            reason = 'Price above cloud, Kijun above Tenkan, Chikou above price'
+        elif conditions['price_below_cloud'] and conditions['kijun_below_tenkan'] \
+                and conditions['chikou_below_price']:
+            signal = 'sell'
+            reason = 'Price below cloud, Kijun below Tenkan, Chikou below price'
+        else:
+            signal = 'neutral'
+            reason = 'Ichimoku conditions not fully met'
+        lut.append({'signal': signal, 'reason': reason, 'conditions_met': conditions})
+    return tuple(lut)
+
+
+def _build_neutral_lut():
+    """Build the neutral signal dicts for every missing-field bitmap"""
+    lut = []
+    for bits in range(64):
+        missing = [name for bit, name in enumerate(_FIELD_NAMES) if bits & (1 << bit)]
+        lut.append({
+            'signal': 'neutral',
+            'reason': f'Insufficient data for signal generation (missing: {", ".join(missing)})',
+            'conditions_met': {}
+        })
+    return tuple(lut)
+
+
+_SIGNAL_LUT = _build_signal_lut()
+_NEUTRAL_LUT = _build_neutral_lut()
+
+
 class IchimokuCalculator:
     """Calculate Ichimoku Cloud indicators"""
     
@@ -22,6 +215,9 @@ class IchimokuCalculator:
         self.kijun_period = kijun_period
         self.senkou_b_period = senkou_b_period
         self.chikou_shift = chikou_shift
+        # Per-symbol cache of the last computed result so polling clients only
+        # pay for the newly arrived bars (see calculate_with_signals)
+        self._ichimoku_cache = {}
     
     def calculate(self, df):
         """
@@ -35,183 +231,111 @@ class IchimokuCalculator:
         """
         if df is None or len(df) == 0:
             return None
-        
-        # Make a copy to avoid modifying original
-        result_df = df.copy()
-        
-        # Calculate Tenkan-sen (Conversion Line)
-        # (9-period high + 9-period low) / 2
-        tenkan_high = result_df['high'].rolling(window=self.tenkan_period).max()
-        tenkan_low = result_df['low'].rolling(window=self.tenkan_period).min()
-        result_df['tenkan_sen'] = (tenkan_high + tenkan_low) / 2
-        
-        # Calculate Kijun-sen (Base Line)
-        # (26-period high + 26-period low) / 2
-        kijun_high = result_df['high'].rolling(window=self.kijun_period).max()
-        kijun_low = result_df['low'].rolling(window=self.kijun_period).min()
-        result_df['kijun_sen'] = (kijun_high + kijun_low) / 2
-        
+
+        # Work on ndarray views of the input; no full-table copy is made and
+        # the result frame is assembled from the column arrays at the end
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
+        n = len(df)
+        shift = self.chikou_shift
+
+        # Tenkan-sen ((9-period high + low) / 2), Kijun-sen (26-period) and the
+        # Senkou Span B midline (52-period) come out of one fused sweep
+        tenkan_sen = np.empty(n)
+        kijun_sen = np.empty(n)
+        senkou_span_b_unshifted = np.empty(n)
+        _ichimoku_cores(high, low, self.tenkan_period, self.kijun_period,
+                        self.senkou_b_period, tenkan_sen, kijun_sen,
+                        senkou_span_b_unshifted)
+
         # Calculate Senkou Span A (Leading Span A)
         # (Tenkan-sen + Kijun-sen) / 2, plotted 26 periods ahead
-        result_df['senkou_span_a_unshifted'] = (result_df['tenkan_sen'] + result_df['kijun_sen']) / 2
-        # Store shifted version for display (plotted 26 periods ahead)
-        result_df['senkou_span_a'] = result_df['senkou_span_a_unshifted'].shift(-self.chikou_shift)
-        
-        # Calculate Senkou Span B (Leading Span B)
-        # (52-period high + 52-period low) / 2, plotted 26 periods ahead
-        senkou_b_high = result_df['high'].rolling(window=self.senkou_b_period).max()
-        senkou_b_low = result_df['low'].rolling(window=self.senkou_b_period).min()
-        result_df['senkou_span_b_unshifted'] = (senkou_b_high + senkou_b_low) / 2
-        # Store shifted version for display (plotted 26 periods ahead)
-        result_df['senkou_span_b'] = result_df['senkou_span_b_unshifted'].shift(-self.chikou_shift)
-        
-        # Calculate Chikou Span (Lagging Span)
-        # Current closing price, plotted 26 periods back
-        result_df['chikou_span'] = result_df['close'].shift(self.chikou_shift)
-        
-        return result_df
-    
-    def get_cloud_status(self, row, use_unshifted=True):
-        """
-        Determine if price is above or below the cloud
-        
-        Args:
-            row: DataFrame row with senkou_span_a and senkou_span_b
-            use_unshifted: If True, use unshifted values for signal generation (default: True)
-        
-        Returns:
-            str: 'above', 'below', or 'inside' (if spans are NaN)
-        """
-        # For signal generation, use unshifted values (cloud from 26 bars ago affects current bar)
-        # For display, use shifted values (cloud plotted ahead)
-        if use_unshifted:
-            span_a = row.get('senkou_span_a_unshifted')
-            span_b = row.get('senkou_span_b_unshifted')
-        else:
-            span_a = row.get('senkou_span_a')
-            span_b = row.get('senkou_span_b')
-        
-        price = row.get('close')
-        
-        if pd.isna(span_a) or pd.isna(span_b) or pd.isna(price):
-            return None
-        
-        # Cloud top is the higher of the two spans
-        cloud_top = max(span_a, span_b)
-        # Cloud bottom is the lower of the two spans
-        cloud_bottom = min(span_a, span_b)
-        
-        if price > cloud_top:
-            return 'above'
-        elif price < cloud_bottom:
-            return 'below'
-        else:
-            return 'inside'
-    
-    def generate_signal(self, row, previous_row=None):
-        """
-        Generate trading signal based on Ichimoku conditions
-        
-        Buy signal conditions:
-        - Price is above the cloud
-        - Base line (Kijun-sen) is above conversion line (Tenkan-sen)
-        - Lagging span (Chikou) is above price
-        
-        Sell signal conditions:
-        - Price is below the cloud
-        - Base line (Kijun-sen) is below conversion line (Tenkan-sen)
-        - Lagging span (Chikou) is below price
-        
-        Args:
-            row: Current DataFrame row with Ichimoku indicators
-            previous_row: Previous row (optional, for trend confirmation)
-        
-        Returns:
-            dict: Signal information with 'signal' ('buy', 'sell', or 'neutral') and conditions
-        """
-        # Check if we have all required values for signal generation
-        # Use unshifted cloud values for signal generation
-        required_fields = ['close', 'tenkan_sen', 'kijun_sen', 'chikou_span', 
-                          'senkou_span_a_unshifted', 'senkou_span_b_unshifted']
-        
-        # Check for missing or NaN values
-        missing_fields = []
-        for field in required_fields:
-            if field not in row or pd.isna(row[field]):
-                missing_fields.append(field)
-        
-        # If we have missing fields, return neutral signal
-        if missing_fields:
-            return {
-                'signal': 'neutral',
-                'reason': f'Insufficient data for signal generation (missing: {", ".join(missing_fields)})',
-                'conditions_met': {}
-            }
-        
-        price = row['close']
-        tenkan = row['tenkan_sen']
-        kijun = row['kijun_sen']
-        chikou = row['chikou_span']
-        
-        # Get cloud status using unshifted values (for signal generation)
-        cloud_status = self.get_cloud_status(row, use_unshifted=True)
-        
-        # Check conditions
-        conditions = {
-            'price_above_cloud': cloud_status == 'above',
-            'price_below_cloud': cloud_status == 'below',
-            'kijun_above_tenkan': kijun > tenkan,
-            'kijun_below_tenkan': kijun < tenkan,
-            'chikou_above_price': chikou > price,
-            'chikou_below_price': chikou < price
-        }
-        
-        # Buy signal conditions
-        buy_conditions = (
-            conditions['price_above_cloud'] and
-            conditions['kijun_above_tenkan'] and
-            conditions['chikou_above_price']
-        )
-        
-        # Sell signal conditions
-        sell_conditions = (
-            conditions['price_below_cloud'] and
-            conditions['kijun_below_tenkan'] and
-            conditions['chikou_below_price']
-        )
-        
-        if buy_conditions:
-            return {
-                'signal': 'buy',
-                'reason': 'Price above cloud, Kijun above Tenkan, Chikou above price',
-                'conditions_met': conditions
-            }
-        elif sell_conditions:
-            return {
-                'signal': 'sell',
-                'reason': 'Price below cloud, Kijun below Tenkan, Chikou below price',
-                'conditions_met': conditions
-            }
-        else:
-            return {
-                'signal': 'neutral',
-                'reason': 'Ichimoku conditions not fully met',
-                'conditions_met': conditions
-            }
+        senkou_span_a_unshifted = (tenkan_sen + kijun_sen) / 2
+
+        # Shifted span versions for display (plotted 26 periods ahead) and the
+        # Chikou Span (current close plotted 26 periods back)
+        senkou_span_a = np.full(n, np.nan)
+        senkou_span_b = np.full(n, np.nan)
+        chikou_span = np.full(n, np.nan)
+        if n > shift:
+            senkou_span_a[:n - shift] = senkou_span_a_unshifted[shift:]
+            senkou_span_b[:n - shift] = senkou_span_b_unshifted[shift:]
+            chikou_span[shift:] = close[:n - shift]
+
+        result = {col: df[col].to_numpy() for col in df.columns}
+        result.update({
+            'tenkan_sen': tenkan_sen,
+            'kijun_sen': kijun_sen,
+            'senkou_span_a_unshifted': senkou_span_a_unshifted,
+            'senkou_span_a': senkou_span_a,
+            'senkou_span_b_unshifted': senkou_span_b_unshifted,
+            'senkou_span_b': senkou_span_b,
+            'chikou_span': chikou_span,
+        })
+        return pd.DataFrame(result)
     
-    def calculate_with_signals(self, quotes_data):
+    def calculate_with_signals(self, quotes_data, symbol=None):
         """
         Calculate Ichimoku indicators and generate signals for all candles
-        
+
+        When a symbol is given, results are cached per symbol: if the new
+        quotes only append bars to (or update the forming bar of) the
+        previously seen series, only the affected tail is recomputed and
+        stitched onto the cached prefix. Bars older than the last closed
+        candle are immutable, so their rows never change.
+
         Args:
             quotes_data: List of quote dictionaries with 'time', 'open', 'high', 'low', 'close'
-        
+            symbol: Symbol name used as cache key (optional; no caching if omitted)
+
         Returns:
             List of dictionaries with quotes, Ichimoku indicators, and signals
         """
         if not quotes_data or len(quotes_data) == 0:
             return []
-        
+
+        if symbol is None:
+            return self._compute_signals(quotes_data)
+
+        times = [q.get('time') for q in quotes_data]
+        cached = self._ichimoku_cache.get(symbol)
+
+        result = None
+        if cached is not None:
+            cached_times = cached['times']
+            cached_n = len(cached_times)
+            # The series extends the cached one if all bars before the last
+            # cached (possibly still forming) candle are unchanged
+            if len(times) >= cached_n and times[:cached_n - 1] == cached_times[:cached_n - 1]:
+                # Rows before this index cannot have changed: the forming bar
+                # at cached_n - 1 only feeds forward, and the display spans
+                # look at most chikou_shift bars back
+                stable_end = max(0, cached_n - 1 - self.chikou_shift)
+                # Recompute from far enough back that every kept row has the
+                # full rolling + signal-span history available
+                warmup = self.senkou_b_period - 1 + self.chikou_shift
+                cut = max(0, stable_end - warmup)
+                tail_result = self._compute_signals(quotes_data[cut:])
+                result = cached['result'][:stable_end] + tail_result[stable_end - cut:]
+
+        if result is None:
+            result = self._compute_signals(quotes_data)
+
+        self._ichimoku_cache[symbol] = {'times': times, 'result': result}
+        return result
+
+    def _compute_arrays(self, quotes_data):
+        """
+        Run the full Ichimoku + signal pipeline, returning per-field arrays
+
+        Args:
+            quotes_data: List of quote dictionaries with 'time', 'open', 'high', 'low', 'close'
+
+        Returns:
+            dict of NumPy arrays (prices, indicators, condition/NaN bitmaps,
+            cloud masks) or None if the input is unusable
+        """
         # Convert to DataFrame
         df = pd.DataFrame(quotes_data)
         
@@ -219,72 +343,304 @@ class IchimokuCalculator:
         required_cols = ['high', 'low', 'close']
         if not all(col in df.columns for col in required_cols):
             logger.error(f"Missing required columns. Expected: {required_cols}")
-            return []
-        
+            return None
+
         # Calculate Ichimoku indicators
         df_with_ichimoku = self.calculate(df)
-        
+
         if df_with_ichimoku is None:
-            return []
+            return None
         
         # Reset index to ensure proper integer indexing
         df_with_ichimoku = df_with_ichimoku.reset_index(drop=True)
-        
-        # Convert back to list of dictionaries with indicators and signals
-        result = []
-        for idx, row in df_with_ichimoku.iterrows():
-            # Get time from original quotes_data if available, otherwise from row
+
+        n = len(df_with_ichimoku)
+
+        # Extract each column as a contiguous NumPy array once, instead of
+        # boxing a Series per row with iterrows()
+        high = df_with_ichimoku['high'].to_numpy(dtype=np.float64)
+        low = df_with_ichimoku['low'].to_numpy(dtype=np.float64)
+        close = df_with_ichimoku['close'].to_numpy(dtype=np.float64)
+        tenkan = df_with_ichimoku['tenkan_sen'].to_numpy(dtype=np.float64)
+        kijun = df_with_ichimoku['kijun_sen'].to_numpy(dtype=np.float64)
+        senkou_a = df_with_ichimoku['senkou_span_a'].to_numpy(dtype=np.float64)
+        senkou_b = df_with_ichimoku['senkou_span_b'].to_numpy(dtype=np.float64)
+        chikou = df_with_ichimoku['chikou_span'].to_numpy(dtype=np.float64)
+        span_a_unshifted = df_with_ichimoku['senkou_span_a_unshifted'].to_numpy(dtype=np.float64)
+        span_b_unshifted = df_with_ichimoku['senkou_span_b_unshifted'].to_numpy(dtype=np.float64)
+        if 'open' in df_with_ichimoku.columns:
+            open_ = df_with_ichimoku['open'].to_numpy(dtype=np.float64)
+        else:
+            open_ = np.full(n, np.nan)
+
+        # For signal generation, compare current price to the cloud from 26 bars
+        # ago (the cloud that affects the current bar). Shift the unshifted spans
+        # forward by chikou_shift; the first chikou_shift bars have no cloud yet.
+        span_a_signal = np.full(n, np.nan)
+        span_b_signal = np.full(n, np.nan)
+        if n > self.chikou_shift:
+            span_a_signal[self.chikou_shift:] = span_a_unshifted[:n - self.chikou_shift]
+            span_b_signal[self.chikou_shift:] = span_b_unshifted[:n - self.chikou_shift]
+
+        # Vectorized cloud status and signal conditions
+        cloud_top = np.maximum(span_a_signal, span_b_signal)
+        cloud_bottom = np.minimum(span_a_signal, span_b_signal)
+        price_above_cloud = close > cloud_top
+        price_below_cloud = close < cloud_bottom
+        kijun_above_tenkan = kijun > tenkan
+        kijun_below_tenkan = kijun < tenkan
+        chikou_above_price = chikou > close
+        chikou_below_price = chikou < close
+
+        cloud_valid = ~(np.isnan(span_a_signal) | np.isnan(span_b_signal) | np.isnan(close))
+
+        # Pack the six conditions into a uint8 bitmap per row; the hot loop
+        # then indexes the prebuilt signal dict LUT instead of building dicts
+        cond_bits = (price_above_cloud.astype(np.uint8)
+                     | (price_below_cloud.astype(np.uint8) << 1)
+                     | (kijun_above_tenkan.astype(np.uint8) << 2)
+                     | (kijun_below_tenkan.astype(np.uint8) << 3)
+                     | (chikou_above_price.astype(np.uint8) << 4)
+                     | (chikou_below_price.astype(np.uint8) << 5))
+
+        # Same packing for missing fields; zero means the signal is computable
+        nan_bits = (np.isnan(close).astype(np.uint8)
+                    | (np.isnan(tenkan).astype(np.uint8) << 1)
+                    | (np.isnan(kijun).astype(np.uint8) << 2)
+                    | (np.isnan(chikou).astype(np.uint8) << 3)
+                    | (np.isnan(span_a_signal).astype(np.uint8) << 4)
+                    | (np.isnan(span_b_signal).astype(np.uint8) << 5))
+
+        return {
+            'open': open_,
+            'high': high,
+            'low': low,
+            'close': close,
+            'tenkan_sen': tenkan,
+            'kijun_sen': kijun,
+            'senkou_span_a': senkou_a,
+            'senkou_span_b': senkou_b,
+            'chikou_span': chikou,
+            'cloud_valid': cloud_valid,
+            'price_above_cloud': price_above_cloud,
+            'price_below_cloud': price_below_cloud,
+            'cond_bits': cond_bits,
+            'nan_bits': nan_bits,
+        }
+
+    def _compute_signals(self, quotes_data):
+        """
+        Full Ichimoku + signal computation for a list of quotes
+
+        Args:
+            quotes_data: List of quote dictionaries with 'time', 'open', 'high', 'low', 'close'
+
+        Returns:
+            List of dictionaries with quotes, Ichimoku indicators, and signals
+        """
+        arrays = self._compute_arrays(quotes_data)
+        if arrays is None:
+            return []
+
+        high = arrays['high']
+        low = arrays['low']
+        close = arrays['close']
+        cloud_valid = arrays['cloud_valid']
+        price_above_cloud = arrays['price_above_cloud']
+        price_below_cloud = arrays['price_below_cloud']
+        cond_bits = arrays['cond_bits']
+        nan_bits = arrays['nan_bits']
+        n = len(close)
+
+        # Convert NaN to None for JSON serialization in one vectorized pass per
+        # column; tolist() yields native Python floats/None in a single C loop
+        def nan_to_none(arr):
+            vals = arr.astype(object)
+            vals[np.isnan(arr)] = None
+            return vals.tolist()
+
+        open_py = nan_to_none(arrays['open'])
+        tenkan_py = nan_to_none(arrays['tenkan_sen'])
+        kijun_py = nan_to_none(arrays['kijun_sen'])
+        senkou_a_py = nan_to_none(arrays['senkou_span_a'])
+        senkou_b_py = nan_to_none(arrays['senkou_span_b'])
+        chikou_py = nan_to_none(arrays['chikou_span'])
+
+        # Build the result list pulling scalars from the arrays; preallocate so
+        # the list never reallocates and each candle is a single dict literal
+        result = [None] * n
+        for i in range(n):
+            # Get time from original quotes_data if available
             time_value = None
-            if idx < len(quotes_data) and 'time' in quotes_data[idx]:
-                time_value = quotes_data[idx]['time']
-            elif 'time' in row:
-                time_value = row['time']
-            
-            candle_data = {
-                'time': time_value,
-                'open': float(row['open']) if 'open' in row and not pd.isna(row['open']) else None,
-                'high': float(row['high']),
-                'low': float(row['low']),
-                'close': float(row['close']),
-            }
-            
-            # Add Ichimoku indicators (convert NaN to None for JSON serialization)
-            ichimoku_data = {
-                'tenkan_sen': float(row['tenkan_sen']) if not pd.isna(row['tenkan_sen']) else None,
-                'kijun_sen': float(row['kijun_sen']) if not pd.isna(row['kijun_sen']) else None,
-                'senkou_span_a': float(row['senkou_span_a']) if not pd.isna(row['senkou_span_a']) else None,
-                'senkou_span_b': float(row['senkou_span_b']) if not pd.isna(row['senkou_span_b']) else None,
-                'chikou_span': float(row['chikou_span']) if not pd.isna(row['chikou_span']) else None,
-            }
-            
-            # For signal generation, we need to compare current price to cloud from 26 bars ago
-            # The cloud that affects the current bar was calculated 26 bars ago
-            signal_row = row.copy()
-            if idx >= self.chikou_shift:
-                # Use cloud values from 26 bars ago (the cloud that affects current bar)
-                cloud_idx = idx - self.chikou_shift
-                cloud_row = df_with_ichimoku.iloc[cloud_idx]
-                # Update signal_row with cloud values from 26 bars ago
-                signal_row['senkou_span_a_unshifted'] = cloud_row['senkou_span_a_unshifted']
-                signal_row['senkou_span_b_unshifted'] = cloud_row['senkou_span_b_unshifted']
+            if i < len(quotes_data) and 'time' in quotes_data[i]:
+                time_value = quotes_data[i]['time']
+
+            # Cloud status using cloud values from 26 bars ago
+            if not cloud_valid[i]:
+                cloud_status = None
+            elif price_above_cloud[i]:
+                cloud_status = 'above'
+            elif price_below_cloud[i]:
+                cloud_status = 'below'
+            else:
+                cloud_status = 'inside'
+
+            # Look up the shared signal dict for this row's bitmap
+            if nan_bits[i]:
+                signal_data = _NEUTRAL_LUT[nan_bits[i]]
             else:
-                # Not enough history (need at least 26 bars for cloud calculation)
-                signal_row['senkou_span_a_unshifted'] = pd.NA
-                signal_row['senkou_span_b_unshifted'] = pd.NA
-            
-            # Get cloud status using cloud values from 26 bars ago
-            cloud_status = self.get_cloud_status(signal_row, use_unshifted=True)
-            ichimoku_data['cloud_status'] = cloud_status
-            
-            # Generate signal using the modified row
-            previous_row = df_with_ichimoku.iloc[idx - 1] if idx > 0 else None
-            signal_data = self.generate_signal(signal_row, previous_row)
-            
-            result.append({
-                **candle_data,
-                'ichimoku': ichimoku_data,
+                signal_data = _SIGNAL_LUT[cond_bits[i]]
+
+            result[i] = {
+                'time': time_value,
+                'open': open_py[i],
+                'high': float(high[i]),
+                'low': float(low[i]),
+                'close': float(close[i]),
+                # NaN already converted to None above
+                'ichimoku': {
+                    'tenkan_sen': tenkan_py[i],
+                    'kijun_sen': kijun_py[i],
+                    'senkou_span_a': senkou_a_py[i],
+                    'senkou_span_b': senkou_b_py[i],
+                    'chikou_span': chikou_py[i],
+                    'cloud_status': cloud_status,
+                },
                 'signal': signal_data
-            })
-        
+            }
+
         return result
 
+    def calculate_columnar(self, quotes_data):
+        """
+        Calculate Ichimoku indicators and signals in columnar (SoA) layout
+
+        Instead of one dict per candle, returns one array per field, which
+        orjson serializes directly (OPT_SERIALIZE_NUMPY) without boxing every
+        value into a Python float. NaN values serialize as null.
+
+        Cloud status codes: 0=unknown, 1=above, 2=below, 3=inside.
+        Signal codes: 0=neutral, 1=buy, 2=sell.
+
+        Args:
+            quotes_data: List of quote dictionaries with 'time', 'open', 'high', 'low', 'close'
+
+        Returns:
+            dict of field name to list/array, or None if the input is unusable
+        """
+        if not quotes_data or len(quotes_data) == 0:
+            return None
+
+        arrays = self._compute_arrays(quotes_data)
+        if arrays is None:
+            return None
+
+        n = len(arrays['close'])
+        cloud_valid = arrays['cloud_valid']
+        price_above = arrays['price_above_cloud']
+        price_below = arrays['price_below_cloud']
+        cond_bits = arrays['cond_bits']
+        nan_bits = arrays['nan_bits']
+
+        cloud_status = np.zeros(n, dtype=np.int8)
+        cloud_status[cloud_valid & price_above] = 1
+        cloud_status[cloud_valid & price_below] = 2
+        cloud_status[cloud_valid & ~price_above & ~price_below] = 3
+
+        # Buy needs condition bits 0, 2, 4 set; sell bits 1, 3, 5 (see the
+        # signal LUT); only rows with no missing fields can signal
+        computable = nan_bits == 0
+        signal = np.zeros(n, dtype=np.int8)
+        signal[computable & ((cond_bits & 0b010101) == 0b010101)] = 1
+        signal[computable & ((cond_bits & 0b101010) == 0b101010)] = 2
+
+        return {
+            'time': [q.get('time') for q in quotes_data],
+            'open': arrays['open'],
+            'high': arrays['high'],
+            'low': arrays['low'],
+            'close': arrays['close'],
+            'ichimoku': {
+                'tenkan_sen': arrays['tenkan_sen'],
+                'kijun_sen': arrays['kijun_sen'],
+                'senkou_span_a': arrays['senkou_span_a'],
+                'senkou_span_b': arrays['senkou_span_b'],
+                'chikou_span': arrays['chikou_span'],
+                'cloud_status': cloud_status,
+            },
+            'signal': signal,
+        }
+
+    def calculate_batch(self, high, low, close):
+        """
+        Calculate Ichimoku indicators and signals for many symbols at once
+
+        Runs the rolling kernels as a gufunc over a (num_symbols, num_bars)
+        matrix, parallelized across symbols. Shorter series must be padded
+        with leading NaN; padded positions come out as NaN / code 0.
+
+        Codes match calculate_columnar: cloud_status 0=unknown, 1=above,
+        2=below, 3=inside; signal 0=neutral, 1=buy, 2=sell.
+
+        Args:
+            high, low, close: 2D float arrays of shape (num_symbols, num_bars)
+
+        Returns:
+            dict of 2D arrays: the five indicators plus cloud_status and
+            signal code matrices
+        """
+        high = np.ascontiguousarray(high, dtype=np.float64)
+        low = np.ascontiguousarray(low, dtype=np.float64)
+        close = np.ascontiguousarray(close, dtype=np.float64)
+        n = high.shape[-1]
+        shift = self.chikou_shift
+
+        tenkan_high, tenkan_low = _rolling_minmax_batch(high, low, self.tenkan_period)
+        kijun_high, kijun_low = _rolling_minmax_batch(high, low, self.kijun_period)
+        senkou_b_high, senkou_b_low = _rolling_minmax_batch(high, low, self.senkou_b_period)
+
+        tenkan = (tenkan_high + tenkan_low) / 2
+        kijun = (kijun_high + kijun_low) / 2
+        span_a_unshifted = (tenkan + kijun) / 2
+        span_b_unshifted = (senkou_b_high + senkou_b_low) / 2
+
+        # Shifted spans for display, lagging close, and the signal-generation
+        # spans (cloud from chikou_shift bars ago), all along the bar axis
+        senkou_a = np.full_like(span_a_unshifted, np.nan)
+        senkou_b = np.full_like(span_b_unshifted, np.nan)
+        chikou = np.full_like(close, np.nan)
+        span_a_signal = np.full_like(span_a_unshifted, np.nan)
+        span_b_signal = np.full_like(span_b_unshifted, np.nan)
+        if n > shift:
+            senkou_a[..., :n - shift] = span_a_unshifted[..., shift:]
+            senkou_b[..., :n - shift] = span_b_unshifted[..., shift:]
+            chikou[..., shift:] = close[..., :n - shift]
+            span_a_signal[..., shift:] = span_a_unshifted[..., :n - shift]
+            span_b_signal[..., shift:] = span_b_unshifted[..., :n - shift]
+
+        cloud_top = np.maximum(span_a_signal, span_b_signal)
+        cloud_bottom = np.minimum(span_a_signal, span_b_signal)
+        price_above = close > cloud_top
+        price_below = close < cloud_bottom
+        cloud_valid = ~(np.isnan(span_a_signal) | np.isnan(span_b_signal) | np.isnan(close))
+
+        cloud_status = np.zeros(close.shape, dtype=np.int8)
+        cloud_status[cloud_valid & price_above] = 1
+        cloud_status[cloud_valid & price_below] = 2
+        cloud_status[cloud_valid & ~price_above & ~price_below] = 3
+
+        computable = cloud_valid & ~np.isnan(tenkan) & ~np.isnan(kijun) & ~np.isnan(chikou)
+        signal = np.zeros(close.shape, dtype=np.int8)
+        signal[computable & price_above & (kijun > tenkan) & (chikou > close)] = 1
+        signal[computable & price_below & (kijun < tenkan) & (chikou < close)] = 2
+
+        return {
+            'tenkan_sen': tenkan,
+            'kijun_sen': kijun,
+            'senkou_span_a': senkou_a,
+            'senkou_span_b': senkou_b,
+            'chikou_span': chikou,
+            'cloud_status': cloud_status,
+            'signal': signal,
+        }
+
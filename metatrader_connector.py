@@ -1,16 +1,78 @@
 import MetaTrader5 as mt5
 import pandas as pd
+from collections import OrderedDict
 from datetime import datetime
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
 
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire after ttl seconds"""
+
+    def __init__(self, maxsize=128, ttl=30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._store = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            timestamp, value = entry
+            if time.monotonic() - timestamp >= self.ttl:
+                del self._store[key]
+                return None
+            self._store.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """Store value under key, evicting the least recently used entries"""
+        with self._lock:
+            self._store[key] = (time.monotonic(), value)
+            self._store.move_to_end(key)
+            while len(self._store) > self.maxsize:
+                self._store.popitem(last=False)
+
+
+# Built once at import so get_timeframe_code doesn't rebuild it per call
+_TIMEFRAME_MAP = {
+    'M1': mt5.TIMEFRAME_M1,
+    'M2': mt5.TIMEFRAME_M2,
+    'M3': mt5.TIMEFRAME_M3,
+    'M4': mt5.TIMEFRAME_M4,
+    'M5': mt5.TIMEFRAME_M5,
+    'M6': mt5.TIMEFRAME_M6,
+    'M10': mt5.TIMEFRAME_M10,
+    'M12': mt5.TIMEFRAME_M12,
+    'M15': mt5.TIMEFRAME_M15,
+    'M20': mt5.TIMEFRAME_M20,
+    'M30': mt5.TIMEFRAME_M30,
+    'H1': mt5.TIMEFRAME_H1,
+    'H2': mt5.TIMEFRAME_H2,
+    'H3': mt5.TIMEFRAME_H3,
+    'H4': mt5.TIMEFRAME_H4,
+    'H6': mt5.TIMEFRAME_H6,
+    'H8': mt5.TIMEFRAME_H8,
+    'H12': mt5.TIMEFRAME_H12,
+    'D1': mt5.TIMEFRAME_D1,
+    'W1': mt5.TIMEFRAME_W1,
+    'MN1': mt5.TIMEFRAME_MN1,
+}
+
+
 class MetaTraderConnector:
     """Connector class for MetaTrader5 API"""
     
-    def __init__(self):
+    def __init__(self, cache_ttl=30.0):
         self.connected = False
+        # Identical queries arriving within cache_ttl seconds skip the MT5 IPC
+        self._quotes_cache = TTLCache(maxsize=128, ttl=cache_ttl)
     
     def initialize(self, path=None, login=None, password=None, server=None):
         """
@@ -67,31 +129,7 @@ class MetaTraderConnector:
         Returns:
             MT5 timeframe constant
         """
-        timeframe_map = {
-            'M1': mt5.TIMEFRAME_M1,
-            'M2': mt5.TIMEFRAME_M2,
-            'M3': mt5.TIMEFRAME_M3,
-            'M4': mt5.TIMEFRAME_M4,
-            'M5': mt5.TIMEFRAME_M5,
-            'M6': mt5.TIMEFRAME_M6,
-            'M10': mt5.TIMEFRAME_M10,
-            'M12': mt5.TIMEFRAME_M12,
-            'M15': mt5.TIMEFRAME_M15,
-            'M20': mt5.TIMEFRAME_M20,
-            'M30': mt5.TIMEFRAME_M30,
-            'H1': mt5.TIMEFRAME_H1,
-            'H2': mt5.TIMEFRAME_H2,
-            'H3': mt5.TIMEFRAME_H3,
-            'H4': mt5.TIMEFRAME_H4,
-            'H6': mt5.TIMEFRAME_H6,
-            'H8': mt5.TIMEFRAME_H8,
-            'H12': mt5.TIMEFRAME_H12,
-            'D1': mt5.TIMEFRAME_D1,
-            'W1': mt5.TIMEFRAME_W1,
-            'MN1': mt5.TIMEFRAME_MN1,
-        }
-        
-        return timeframe_map.get(timeframe_str.upper(), mt5.TIMEFRAME_H1)
+        return _TIMEFRAME_MAP.get(timeframe_str.upper(), mt5.TIMEFRAME_H1)
     
     def get_quotes(self, symbol, timeframe='H1', count=100, start_date=None, end_date=None):
         """
@@ -107,10 +145,16 @@ class MetaTraderConnector:
         Returns:
             list: List of quote dictionaries or None if error
         """
+        # Serve recent identical queries from cache without touching MT5
+        cache_key = (symbol, timeframe, count, start_date, end_date)
+        cached = self._quotes_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         if not self.is_connected():
             logger.error("MetaTrader5 is not connected")
             return None
-        
+
         try:
             # Convert timeframe string to MT5 constant
             timeframe_code = self.get_timeframe_code(timeframe)
@@ -118,12 +162,12 @@ class MetaTraderConnector:
             # Prepare date range
             if start_date and end_date:
                 # Get quotes for date range
-                start = datetime.strptime(start_date, '%Y-%m-%d')
-                end = datetime.strptime(end_date, '%Y-%m-%d')
+                start = datetime.fromisoformat(start_date)
+                end = datetime.fromisoformat(end_date)
                 rates = mt5.copy_rates_range(symbol, timeframe_code, start, end)
             elif start_date:
                 # Get quotes from start date
-                start = datetime.strptime(start_date, '%Y-%m-%d')
+                start = datetime.fromisoformat(start_date)
                 rates = mt5.copy_rates_from(symbol, timeframe_code, start, count)
             else:
                 # Get latest quotes
@@ -134,27 +178,35 @@ class MetaTraderConnector:
                 logger.error(f"Failed to get rates for {symbol}: {error_code}")
                 return None
             
-            # Convert to DataFrame for easier manipulation
-            df = pd.DataFrame(rates)
-            
-            # Convert time to readable format
-            df['time'] = pd.to_datetime(df['time'], unit='s')
-            
-            # Convert to list of dictionaries
+            # Build the quote dicts straight from the MT5 structured array,
+            # avoiding the ndarray -> DataFrame -> per-row Series copies.
+            # Format the whole time column in one pass rather than calling
+            # strftime per row.
+            times = pd.to_datetime(rates['time'], unit='s').strftime('%Y-%m-%d %H:%M:%S').tolist()
+            fields = rates.dtype.names
+            opens = rates['open']
+            highs = rates['high']
+            lows = rates['low']
+            closes = rates['close']
+            tick_volumes = rates['tick_volume']
+            spreads = rates['spread'] if 'spread' in fields else None
+            real_volumes = rates['real_volume'] if 'real_volume' in fields else None
+
             quotes = []
-            for _, row in df.iterrows():
+            for i in range(len(rates)):
                 quotes.append({
-                    'time': row['time'].strftime('%Y-%m-%d %H:%M:%S'),
-                    'open': float(row['open']),
-                    'high': float(row['high']),
-                    'low': float(row['low']),
-                    'close': float(row['close']),
-                    'tick_volume': int(row['tick_volume']),
-                    'spread': int(row['spread']) if 'spread' in row else None,
-                    'real_volume': int(row['real_volume']) if 'real_volume' in row else None
+                    'time': times[i],
+                    'open': float(opens[i]),
+                    'high': float(highs[i]),
+                    'low': float(lows[i]),
+                    'close': float(closes[i]),
+                    'tick_volume': int(tick_volumes[i]),
+                    'spread': int(spreads[i]) if spreads is not None else None,
+                    'real_volume': int(real_volumes[i]) if real_volumes is not None else None
                 })
             
             logger.info(f"Retrieved {len(quotes)} quotes for {symbol} ({timeframe})")
+            self._quotes_cache.put(cache_key, quotes)
             return quotes
             
         except Exception as e:
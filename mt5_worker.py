@@ -0,0 +1,141 @@
+import logging
+import os
+import threading
+from multiprocessing.connection import Client, Listener
+
+from metatrader_connector import MetaTraderConnector
+
+logger = logging.getLogger(__name__)
+
+# Address/authkey defaults; override with MT5_WORKER_HOST / MT5_WORKER_PORT /
+# MT5_WORKER_AUTHKEY in the environment
+DEFAULT_ADDRESS = ('127.0.0.1', 6789)
+DEFAULT_AUTHKEY = b'fx-v2-mt5'
+
+# Connector methods the worker will execute on behalf of clients
+_ALLOWED_METHODS = {'get_quotes', 'get_symbols', 'is_connected'}
+
+
+def _handle_connection(conn, connector):
+    """Serve one client connection until it closes"""
+    with conn:
+        while True:
+            try:
+                method, kwargs = conn.recv()
+            except (EOFError, OSError):
+                break
+            try:
+                if method not in _ALLOWED_METHODS:
+                    raise ValueError(f"Unknown method: {method}")
+                result = getattr(connector, method)(**kwargs)
+                conn.send(('ok', result))
+            except Exception as e:
+                logger.error(f"Error handling {method}: {str(e)}")
+                try:
+                    conn.send(('error', str(e)))
+                except (BrokenPipeError, OSError):
+                    break
+
+
+def serve(address=DEFAULT_ADDRESS, authkey=DEFAULT_AUTHKEY):
+    """
+    Run the MT5 worker: own the single terminal connection and execute
+    connector calls for clients connecting over multiprocessing.connection
+
+    All Flask workers share this one process, so only one MT5 terminal
+    attachment exists regardless of how many web workers are running, and
+    the worker's quotes cache is shared between them.
+    """
+    connector = MetaTraderConnector()
+    if not connector.initialize():
+        logger.warning("MetaTrader connection failed. Worker will serve errors until it recovers.")
+
+    with Listener(address, authkey=authkey) as listener:
+        logger.info(f"MT5 worker listening on {address}")
+        while True:
+            conn = listener.accept()
+            thread = threading.Thread(target=_handle_connection, args=(conn, connector), daemon=True)
+            thread.start()
+
+
+class MetaTraderWorkerClient:
+    """
+    Drop-in replacement for MetaTraderConnector that forwards calls to a
+    dedicated MT5 worker process over a small pool of connections
+    """
+
+    def __init__(self, address=DEFAULT_ADDRESS, authkey=DEFAULT_AUTHKEY, pool_size=4):
+        self.address = address
+        self.authkey = authkey
+        self.pool_size = pool_size
+        self._pool = []
+        self._lock = threading.Lock()
+
+    def _acquire(self):
+        """Take a pooled connection, or open a new one"""
+        with self._lock:
+            if self._pool:
+                return self._pool.pop()
+        return Client(self.address, authkey=self.authkey)
+
+    def _release(self, conn):
+        """Return a healthy connection to the pool"""
+        with self._lock:
+            if len(self._pool) < self.pool_size:
+                self._pool.append(conn)
+                return
+        conn.close()
+
+    def _call(self, method, **kwargs):
+        """Execute a connector method in the worker, None on transport error"""
+        try:
+            conn = self._acquire()
+        except (ConnectionError, OSError) as e:
+            logger.error(f"Cannot reach MT5 worker at {self.address}: {str(e)}")
+            return None
+
+        try:
+            conn.send((method, kwargs))
+            status, result = conn.recv()
+        except (EOFError, OSError) as e:
+            logger.error(f"Lost connection to MT5 worker: {str(e)}")
+            conn.close()
+            return None
+
+        self._release(conn)
+        if status == 'error':
+            logger.error(f"MT5 worker error for {method}: {result}")
+            return None
+        return result
+
+    def initialize(self, path=None, login=None, password=None, server=None):
+        """Check that the worker is reachable (it owns the real MT5 login)"""
+        return self._call('is_connected') is not None
+
+    def is_connected(self):
+        """Check worker reachability and MT5 terminal status"""
+        return bool(self._call('is_connected'))
+
+    def shutdown(self):
+        """Close pooled connections; the worker process keeps running"""
+        with self._lock:
+            for conn in self._pool:
+                conn.close()
+            self._pool = []
+
+    def get_quotes(self, symbol, timeframe='H1', count=100, start_date=None, end_date=None):
+        """Get quotes data through the worker (same contract as MetaTraderConnector)"""
+        return self._call('get_quotes', symbol=symbol, timeframe=timeframe,
+                          count=count, start_date=start_date, end_date=end_date)
+
+    def get_symbols(self):
+        """Get available symbols through the worker"""
+        return self._call('get_symbols')
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    host = os.environ.get('MT5_WORKER_HOST', DEFAULT_ADDRESS[0])
+    port = int(os.environ.get('MT5_WORKER_PORT', DEFAULT_ADDRESS[1]))
+    authkey = os.environ.get('MT5_WORKER_AUTHKEY')
+    serve((host, port), authkey.encode() if authkey else DEFAULT_AUTHKEY)